@@ -8,21 +8,39 @@ and exits with appropriate status codes for use in GitHub Actions.
 """
 
 import argparse
+import asyncio
 import logging
+import re
 import sys
-import time
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-from typing import Dict, List, Set, Tuple
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from lxml import html as lxml_html
+
+# Only these HTTP status codes are reported as broken links
+BROKEN_STATUSES = {
+    404: "Not Found",
+    500: "Internal Server Error",
+}
+
+# hrefs that are never checked: non-HTTP schemes and fragment-only links to the current page
+SKIP_RE = re.compile(r'^(mailto:|tel:|javascript:|data:|#)', re.IGNORECASE)
+
+# Shared libxml2 HTML parser, reused for every page (the crawl runs on a single thread)
+HTML_PARSER = lxml_html.HTMLParser()
+
+
+@lru_cache(maxsize=8192)
+def _parse(url: str):
+    """Memoized urlparse; the same page URLs are parsed many times during a crawl."""
+    return urlparse(url)
 
 
 class LinkVerifier:
-    def __init__(self, base_url: str = "https://llm-d.ai", timeout: int = 30, delay: float = 1.0, max_workers: int = 10):
+    def __init__(self, base_url: str = "https://llm-d.ai", timeout: int = 30, delay: float = 1.0, max_workers: int = 50):
         """
         Initialize the Link Verifier.
         
@@ -30,35 +48,29 @@ class LinkVerifier:
             base_url: The base URL to start crawling from
             timeout: Timeout for HTTP requests in seconds
             delay: Delay between requests to be respectful to the server
-            max_workers: Maximum number of concurrent threads for link checking
+            max_workers: Maximum number of in-flight HTTP requests
         """
         self.base_url = base_url
+        # Same-host URLs (either scheme) are recognised by plain string prefix checks
+        self._base_netloc = urlparse(base_url).netloc
+        self._base_origins = tuple(f"{scheme}://{self._base_netloc}" for scheme in ('https', 'http'))
+        self._base_prefixes = tuple(origin + sep for origin in self._base_origins for sep in '/?#')
         self.timeout = timeout
         self.delay = delay
         self.max_workers = max_workers
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'llm-d-docs-verifier/1.0 (Link Checker)'
-        })
+        }
         
-        # Configure connection pooling for better performance
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=20,
-            pool_maxsize=100,
-            max_retries=1
-        )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
+        # Created inside the event loop by verify_all_links()
+        self.client: httpx.AsyncClient = None
+        self.semaphore: asyncio.Semaphore = None
         
-        # Thread-safe data structures
-        self.checked_links: Set[str] = set()
-        self.broken_links: Dict[str, List[Tuple[str, str]]] = defaultdict(list)  # url -> [(source_page, error)]
-        self.successful_links: Set[str] = set()
-        
-        # Thread locks for synchronization
-        self.checked_links_lock = Lock()
-        self.broken_links_lock = Lock()
-        self.successful_links_lock = Lock()
+        # hash(url) -> (status_code, error) for HTTP responses, None when no response was received.
+        # Keyed by the 64-bit string hash so the cache holds no URL strings; broken_links keeps the URLs it reports.
+        self.results: Dict[int, Optional[Tuple[int, str]]] = {}
+        self.broken_links: Deque[Tuple[str, str, str]] = deque()  # (url, source_page, error)
+        self._page_cache: Dict[str, List[str]] = {}  # page url -> links, so no page is fetched twice per run
         
         # Setup logging
         logging.basicConfig(
@@ -69,9 +81,11 @@ class LinkVerifier:
 
     def is_external_link(self, url: str) -> bool:
         """Check if a URL is external to the base domain."""
-        parsed_base = urlparse(self.base_url)
-        parsed_url = urlparse(url)
-        return parsed_url.netloc and parsed_url.netloc != parsed_base.netloc
+        if url.startswith(('http://', 'https://')):
+            return not (url.startswith(self._base_prefixes) or url in self._base_origins)
+        # Other schemes (ftp://, ...) fall back to comparing hosts
+        netloc = _parse(url).netloc
+        return bool(netloc) and netloc != self._base_netloc
 
     def normalize_url(self, url: str, base_url: str) -> str:
         """Normalize and resolve relative URLs."""
@@ -83,8 +97,12 @@ class LinkVerifier:
         if not url.startswith(('http://', 'https://')):
             url = urljoin(base_url, url)
         
+        # Most URLs have no fragment and need no further parsing
+        if '#' not in url:
+            return url
+        
         # Remove fragment for checking (but keep for display)
-        parsed = urlparse(url)
+        parsed = _parse(url)
         if parsed.fragment:
             # For fragment URLs, we'll check the base URL
             base_without_fragment = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
@@ -94,35 +112,77 @@ class LinkVerifier:
         
         return url
 
-    def get_links_from_page(self, url: str) -> List[str]:
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create the shared HTTP/2 client; requests to one origin are multiplexed over one connection."""
+        # The semaphore caps in-flight requests at max_workers, so size the pool to match and keep
+        # every connection alive between bursts instead of reconnecting
+        limits = httpx.Limits(
+            max_connections=self.max_workers,
+            max_keepalive_connections=self.max_workers,
+            keepalive_expiry=30.0
+        )
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=1)
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            headers=self.headers,
+            follow_redirects=True
+        )
+
+    async def get_links_from_page(self, url: str) -> List[str]:
         """Extract all links from a given page."""
+        if url in self._page_cache:
+            return self._page_cache[url]
+        
         try:
             self.logger.info(f"Fetching page: {url}")
-            response = self.session.get(url, timeout=self.timeout)
+            async with self.semaphore:
+                response = await self.client.get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            links = []
+            doc = lxml_html.fromstring(response.content, base_url=url, parser=HTML_PARSER)
+            found = set()  # Deduplicates as links are collected
             
             # Find all anchor tags with href attributes
-            for link in soup.find_all('a', href=True):
-                href = link['href'].strip()
-                if href and not href.startswith('mailto:') and not href.startswith('tel:'):
+            for element, attribute, href, _ in doc.iterlinks():
+                if element.tag != 'a' or attribute != 'href':
+                    continue
+                href = href.strip()
+                if href and not SKIP_RE.match(href):
                     normalized_url = self.normalize_url(href, url)
-                    links.append(normalized_url)
+                    found.add(normalized_url)
             
             # Also check for links in other elements (like buttons with onclick, etc.)
             # For now, focusing on anchor tags as they're the most common
             
-            return list(set(links))  # Remove duplicates
+            links = list(found)
             
         except Exception as e:
             self.logger.error(f"Error fetching page {url}: {str(e)}")
-            return []
+            links = []
+        
+        self._page_cache[url] = links
+        return links
+
+    async def _fetch_status(self, url: str) -> int:
+        """Return the HTTP status for a URL without downloading the response body."""
+        async with self.semaphore:
+            # Streaming GET asking for a single byte: range-aware servers answer 206 with a
+            # one-byte body, others have only their headers read before the response is closed
+            async with self.client.stream('GET', url, headers={'Range': 'bytes=0-0'}) as response:
+                if response.status_code == 206:
+                    # Drain the single byte so the connection can go back to the pool
+                    await response.aread()
+                return response.status_code
 
-    def check_link(self, url: str, source_page: str) -> bool:
+    @staticmethod
+    def _is_ok(result: object) -> bool:
+        """Interpret a stored result; checks still in flight count as OK."""
+        return not isinstance(result, tuple) or result[0] not in BROKEN_STATUSES
+
+    async def check_link(self, url: str, source_page: str) -> bool:
         """
-        Check if a single link is working (thread-safe).
+        Check if a single link is working.
         
         Args:
             url: The URL to check
@@ -131,121 +191,103 @@ class LinkVerifier:
         Returns:
             True if link is working, False otherwise
         """
-        # Thread-safe check if already processed
-        with self.checked_links_lock:
-            if url in self.checked_links:
-                with self.successful_links_lock:
-                    return url in self.successful_links
-            self.checked_links.add(url)
+        # Claim the URL with a single dict operation; return the cached result if already claimed
+        key = hash(url)
+        sentinel = object()
+        prior = self.results.setdefault(key, sentinel)
+        if prior is not sentinel:
+            return self._is_ok(prior)
         
         try:
             self.logger.info(f"Checking link: {url}")
             
-            # Use HEAD request first to be more efficient
-            try:
-                response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
-                if response.status_code == 405:  # Method not allowed, try GET
-                    response = self.session.get(url, timeout=self.timeout)
-            except requests.exceptions.RequestException:
-                # If HEAD fails, try GET
-                response = self.session.get(url, timeout=self.timeout)
+            status = await self._fetch_status(url)
             
             # Only treat 404 and 500 as broken links
-            if response.status_code == 404:
-                error_msg = f"HTTP {response.status_code} - Not Found"
-                with self.broken_links_lock:
-                    self.broken_links[url].append((source_page, error_msg))
-                self.logger.warning(f"✗ Link broken: {url} - {error_msg} (found on: {source_page})")
-                return False
-            elif response.status_code == 500:
-                error_msg = f"HTTP {response.status_code} - Internal Server Error"
-                with self.broken_links_lock:
-                    self.broken_links[url].append((source_page, error_msg))
+            if status in BROKEN_STATUSES:
+                error_msg = f"HTTP {status} - {BROKEN_STATUSES[status]}"
+                self.results[key] = (status, error_msg)
+                self.broken_links.append((url, source_page, error_msg))
                 self.logger.warning(f"✗ Link broken: {url} - {error_msg} (found on: {source_page})")
                 return False
             else:
                 # All other status codes (200, 403, 301, 302, etc.) are considered acceptable
-                with self.successful_links_lock:
-                    self.successful_links.add(url)
-                if response.status_code == 200:
+                self.results[key] = (status, "")
+                if status in (200, 206):  # 206 answers the single-byte range request
                     self.logger.info(f"✓ Link OK: {url}")
                 else:
-                    self.logger.info(f"✓ Link OK: {url} - HTTP {response.status_code}")
+                    self.logger.info(f"✓ Link OK: {url} - HTTP {status}")
                 return True
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             # Timeouts are not considered broken links, just inaccessible at the moment
-            with self.successful_links_lock:
-                self.successful_links.add(url)
+            self.results[key] = None
             self.logger.info(f"⚠️  Link timeout (but not broken): {url} (found on: {source_page})")
             return True
             
-        except requests.exceptions.ConnectionError:
+        except httpx.TransportError:
             # Connection errors are not considered broken links, just inaccessible at the moment
-            with self.successful_links_lock:
-                self.successful_links.add(url)
+            self.results[key] = None
             self.logger.info(f"⚠️  Link connection error (but not broken): {url} (found on: {source_page})")
             return True
             
         except Exception as e:
             # Other errors are not considered broken links, just inaccessible at the moment
-            with self.successful_links_lock:
-                self.successful_links.add(url)
+            self.results[key] = None
             self.logger.info(f"⚠️  Link error (but not broken): {url} - {str(e)} (found on: {source_page})")
             return True
 
-    def get_all_pages_concurrent(self) -> List[str]:
+    async def _crawl_worker(self, queue: asyncio.Queue, seen: Set[str], page_links: Dict[str, List[str]]) -> None:
+        """Fetch pages from the queue, enqueueing any newly discovered internal pages."""
+        while True:
+            page_url = await queue.get()
+            try:
+                links = await self.get_links_from_page(page_url)
+                page_links[page_url] = links
+                
+                # Filter for internal pages to add to crawling queue
+                for link in links:
+                    if not self.is_external_link(link) and link not in seen:
+                        # Only add if it's a different page (not just a fragment)
+                        parsed_link = _parse(link)
+                        parsed_page = _parse(page_url)
+                        if parsed_link.path != parsed_page.path:
+                            seen.add(link)
+                            queue.put_nowait(link)
+                            self.logger.info(f"Found internal page: {link}")
+                
+                # Small delay between pages to be respectful
+                if self.delay > 0:
+                    await asyncio.sleep(self.delay / 2)
+            except Exception as e:
+                self.logger.error(f"Error processing page {page_url}: {e}")
+            finally:
+                queue.task_done()
+
+    async def get_all_pages_concurrent(self) -> Dict[str, List[str]]:
         """
         Discover all internal pages concurrently.
         
         Returns:
-            List of page URLs to check
+            Mapping of each discovered page URL to the links found on it
         """
-        pages_to_check = [self.base_url]
-        checked_pages = set()
+        queue: asyncio.Queue = asyncio.Queue()
+        seen: Set[str] = {self.base_url}
+        page_links: Dict[str, List[str]] = {}
+        queue.put_nowait(self.base_url)
         
-        # Process pages in batches to avoid overwhelming the server
-        batch_size = min(5, self.max_workers)
+        workers = [
+            asyncio.create_task(self._crawl_worker(queue, seen, page_links))
+            for _ in range(self.max_workers)
+        ]
         
-        while True:
-            # Get the next batch of unchecked pages
-            unchecked_pages = [p for p in pages_to_check if p not in checked_pages]
-            if not unchecked_pages:
-                break
-                
-            current_batch = unchecked_pages[:batch_size]
-            
-            # Process batch concurrently
-            with ThreadPoolExecutor(max_workers=batch_size) as executor:
-                future_to_page = {executor.submit(self.get_links_from_page, page): page 
-                                for page in current_batch}
-                
-                for future in as_completed(future_to_page):
-                    page_url = future_to_page[future]
-                    checked_pages.add(page_url)
-                    
-                    try:
-                        links = future.result()
-                        
-                        # Filter for internal pages to add to crawling list
-                        for link in links:
-                            if (not self.is_external_link(link) and 
-                                link not in checked_pages and 
-                                link not in pages_to_check):
-                                # Only add if it's a different page (not just a fragment)
-                                parsed_link = urlparse(link)
-                                parsed_page = urlparse(page_url)
-                                if parsed_link.path != parsed_page.path:
-                                    pages_to_check.append(link)
-                                    self.logger.info(f"Found internal page: {link}")
-                    except Exception as e:
-                        self.logger.error(f"Error processing page {page_url}: {e}")
-            
-            # Small delay between batches to be respectful
-            if self.delay > 0 and unchecked_pages:
-                time.sleep(self.delay / 2)
+        # Wait until every discovered page has been processed, then stop the idle workers
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
         
-        return pages_to_check
+        return page_links
 
     def verify_all_links(self) -> bool:
         """
@@ -254,65 +296,52 @@ class LinkVerifier:
         Returns:
             True if all links are working, False if any broken links found
         """
+        return asyncio.run(self._verify_all_links())
+
+    async def _verify_all_links(self) -> bool:
+        """Run the crawl and link checks on a single event loop."""
         self.logger.info(f"Starting link verification for {self.base_url}")
-        self.logger.info(f"Using {self.max_workers} concurrent workers")
-        
-        # Discover all pages concurrently
-        pages_to_check = self.get_all_pages_concurrent()
-        self.logger.info(f"Found {len(pages_to_check)} pages to check")
+        self.logger.info(f"Using up to {self.max_workers} concurrent requests")
         
-        # Collect all links from all pages concurrently
-        all_links = []
-        
-        with ThreadPoolExecutor(max_workers=min(len(pages_to_check), self.max_workers)) as executor:
-            future_to_page = {executor.submit(self.get_links_from_page, page): page 
-                            for page in pages_to_check}
+        self.semaphore = asyncio.Semaphore(self.max_workers)
+        async with self._new_client() as self.client:
+            # Discover all pages concurrently, keeping the links found on each
+            page_links = await self.get_all_pages_concurrent()
+            self.logger.info(f"Found {len(page_links)} pages to check")
             
-            for future in as_completed(future_to_page):
-                page_url = future_to_page[future]
-                try:
-                    links = future.result()
-                    for link in links:
-                        all_links.append((link, page_url))
-                except Exception as e:
-                    self.logger.error(f"Error getting links from {page_url}: {e}")
-        
-        self.logger.info(f"Found {len(all_links)} total links to verify")
-        
-        # Create unique links dictionary
-        unique_links = {}
-        for link, source in all_links:
-            if link not in unique_links:
-                unique_links[link] = []
-            unique_links[link].append(source)
-        
-        self.logger.info(f"Checking {len(unique_links)} unique links concurrently...")
-        
-        # Check all links concurrently
-        success_count = 0
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all link checking tasks
-            future_to_url = {
-                executor.submit(self.check_link, url, sources[0]): url 
-                for url, sources in unique_links.items()
-            }
+            # Collect the links gathered during discovery
+            all_links = []
+            for page_url, links in page_links.items():
+                for link in links:
+                    all_links.append((link, page_url))
+            
+            self.logger.info(f"Found {len(all_links)} total links to verify")
+            
+            # Create unique links dictionary
+            unique_links = {}
+            for link, source in all_links:
+                if link not in unique_links:
+                    unique_links[link] = []
+                unique_links[link].append(source)
             
-            # Process completed tasks
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    if future.result():
-                        success_count += 1
-                except Exception as e:
-                    self.logger.error(f"Error checking link {url}: {e}")
-                    # Treat as broken
-                    with self.broken_links_lock:
-                        self.broken_links[url].append(("unknown", f"Error: {e}"))
+            self.logger.info(f"Checking {len(unique_links)} unique links concurrently...")
+            
+            # Check all links concurrently
+            results = await asyncio.gather(
+                *(self.check_link(url, sources[0]) for url, sources in unique_links.items()),
+                return_exceptions=True
+            )
+        
+        for url, result in zip(unique_links, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error checking link {url}: {result}")
+                # Treat as broken
+                self.broken_links.append((url, "unknown", f"Error: {result}"))
         
-        # Report results
+        # Report results; every unique link is either broken or successful
         total_links = len(unique_links)
         broken_count = len(self.broken_links)
+        success_count = total_links - broken_count
         
         self.logger.info(f"\n{'='*60}")
         self.logger.info("LINK VERIFICATION RESULTS")
@@ -326,11 +355,10 @@ class LinkVerifier:
             self.logger.error("BROKEN LINKS FOUND (HTTP 404 & 500 ONLY):")
             self.logger.error(f"{'='*60}")
             
-            for url, sources_and_errors in self.broken_links.items():
+            for url, source, error in self.broken_links:
                 self.logger.error(f"\n❌ BROKEN LINK: {url}")
-                for source, error in sources_and_errors:
-                    self.logger.error(f"   📄 Found on page: {source}")
-                    self.logger.error(f"   💥 Error: {error}")
+                self.logger.error(f"   📄 Found on page: {source}")
+                self.logger.error(f"   💥 Error: {error}")
         else:
             self.logger.info("\n✅ No broken links found (checked for HTTP 404 & 500 errors only)!")
         
@@ -341,7 +369,7 @@ def main():
     parser.add_argument('--url', default='https://llm-d.ai', help='Base URL to check (default: https://llm-d.ai)')
     parser.add_argument('--timeout', type=int, default=30, help='Timeout for HTTP requests in seconds (default: 30)')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests in seconds (default: 1.0)')
-    parser.add_argument('--max-workers', type=int, default=10, help='Maximum number of concurrent workers (default: 10)')
+    parser.add_argument('--max-workers', type=int, default=50, help='Maximum number of concurrent requests (default: 50)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
     
     args = parser.parse_args()